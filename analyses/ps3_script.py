@@ -14,11 +14,12 @@ from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import OneHotEncoder, SplineTransformer, StandardScaler
 
 from ps3.data import create_sample_split, load_transform
+from ps3.model_training import continue_lgbm, warm_start_glm
 from ps3.preprocessing import Winsorizer
 
 # %%
 # load data
-df = load_transform()
+df, binner = load_transform(return_binner=True)
 df.head()
 
 # %%
@@ -466,3 +467,31 @@ plot_metric(
 
 # What do you notice, is the estimator tuned optimally?
 # %%
+###### Monthly refresh ######
+# Instead of refitting from scratch when new data comes in, warm-start the GLM from its
+# previous coefficients and add trees to the tuned LGBM. The preprocessing stays fixed
+# unless the inputs drifted. Here the test set stands in for the new month of data.
+# The GLM is refitted on all data so far, the LGBM only boosts on the new month.
+X_all_t = pd.concat([X_train_t, X_test_t])
+y_all_t = pd.concat([y_train_t, y_test_t])
+w_all_t = np.concatenate([w_train_t, w_test_t])
+
+t_glm1_refreshed = warm_start_glm(
+    t_glm1,
+    X_all_t,
+    y_all_t,
+    sample_weight=w_all_t,
+    X_new=X_test_t,
+    X_reference=X_train_t,
+)
+lgbm_refreshed = continue_lgbm(
+    cv.best_estimator_,
+    X_test_t,
+    y_test_t,
+    sample_weight=w_test_t,
+    n_estimators=20,
+    X_reference=X_train_t,
+    X_full=X_all_t,
+    y_full=y_all_t,
+    sample_weight_full=w_all_t,
+)
@@ -1,4 +1,4 @@
-from ._load_transform import load_transform
+from ._load_transform import FEATURE_BINS, load_transform
 from ._sample_split import create_sample_split
 
-__all__ = ["create_sample_split", "load_transform"]
+__all__ = ["FEATURE_BINS", "create_sample_split", "load_transform"]
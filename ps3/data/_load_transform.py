@@ -1,8 +1,18 @@
 import numpy as np
 import pandas as pd
 
+from ps3.preprocessing import FeatureBinner
 
-def load_transform():
+# Clip and/or bin rules for FeatureBinner, shared by training and scoring.
+# VehAge: 10 joins the [1, 10) bin, hence the upper edge of 11.
+FEATURE_BINS = {
+    "VehPower": {"clip": (None, 9)},
+    "VehAge": {"edges": [1, 11]},
+    "DrivAge": {"edges": [21, 26, 31, 41, 51, 71]},
+}
+
+
+def load_transform(return_binner: bool = False):
     """Load and transform data from OpenML.
 
     Source: https://glum.readthedocs.io/en/latest/tutorials/glm_french_motor_tutorial/glm_french_motor.html#
@@ -24,7 +34,20 @@ def load_transform():
        ``freMTPL2freq``.
     5. We fix ``'ClaimNb'`` as the claim number with claim amount greater zero.
     6. ``'VehPower'``, ``'VehAge'``, and ``'DrivAge'`` are clipped and/or digitized
-       into bins so they can be used as categoricals later on.
+       into int8 bins according to ``FEATURE_BINS`` so they can be used as
+       categoricals later on.
+
+    Parameters
+    ----------
+    return_binner : bool, optional
+        Also return the fitted ``FeatureBinner``, by default False. Persist it and
+        apply ``binner.transform`` to raw data at scoring time so that scoring uses
+        exactly the bins of training.
+
+    Returns
+    -------
+    pd.DataFrame or tuple of (pd.DataFrame, FeatureBinner)
+        Transformed data, and the fitted binner if ``return_binner`` is True.
     """
     # load the datasets
     # first row (=column names) uses "", all other rows use ''
@@ -60,12 +83,12 @@ def load_transform():
     df["Exposure"] = df["Exposure"].clip(upper=1)
 
     # Clip and/or digitize predictors into bins
-    df["VehPower"] = np.minimum(df["VehPower"], 9)
-    df["VehAge"] = np.digitize(
-        np.where(df["VehAge"] == 10, 9, df["VehAge"]), bins=[1, 10]
-    )
-    df["DrivAge"] = np.digitize(df["DrivAge"], bins=[21, 26, 31, 41, 51, 71])
+    binner = FeatureBinner(FEATURE_BINS).fit(df)
+    binned = binner.transform(df)
+    df[binned.columns] = binned
 
     df = df.reset_index()
 
+    if return_binner:
+        return df, binner
     return df
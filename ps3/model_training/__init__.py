@@ -0,0 +1,13 @@
+from ._warm_start import (
+    continue_lgbm,
+    population_stability_index,
+    preprocessing_drift,
+    warm_start_glm,
+)
+
+__all__ = [
+    "continue_lgbm",
+    "population_stability_index",
+    "preprocessing_drift",
+    "warm_start_glm",
+]
@@ -0,0 +1,291 @@
+import copy
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.pipeline import Pipeline
+
+
+def population_stability_index(expected, actual, n_bins: int = 10) -> float:
+    """
+    Compute the population stability index (PSI) of ``actual`` against ``expected``.
+
+    Numeric columns are bucketed on the quantiles of ``expected``, all other columns
+    are compared on their category frequencies.
+
+    Parameters
+    ----------
+    expected : array-like
+        Reference values, e.g. the data the preprocessing was fitted on.
+    actual : array-like
+        New values to compare against the reference.
+    n_bins : int, optional
+        Number of quantile buckets for numeric columns, by default 10
+
+    Returns
+    -------
+    float
+        PSI. As a rule of thumb, values above 0.2 indicate a significant shift.
+    """
+    expected = pd.Series(np.asarray(expected))
+    actual = pd.Series(np.asarray(actual))
+
+    if pd.api.types.is_numeric_dtype(expected) and expected.nunique() > n_bins:
+        edges = np.unique(np.quantile(expected, np.linspace(0, 1, n_bins + 1))[1:-1])
+        expected_counts = np.bincount(
+            np.searchsorted(edges, expected, side="right"), minlength=len(edges) + 1
+        )
+        actual_counts = np.bincount(
+            np.searchsorted(edges, actual, side="right"), minlength=len(edges) + 1
+        )
+    else:
+        expected = expected.astype(object)
+        actual = actual.astype(object)
+        categories = pd.Index(expected.unique()).append(pd.Index(actual.unique()))
+        categories = categories.unique()
+        expected_counts = expected.value_counts().reindex(categories, fill_value=0)
+        actual_counts = actual.value_counts().reindex(categories, fill_value=0)
+        expected_counts = expected_counts.to_numpy()
+        actual_counts = actual_counts.to_numpy()
+
+    # Floor the shares so that empty buckets do not blow up the log ratio
+    p = np.maximum(expected_counts / expected_counts.sum(), 1e-6)
+    q = np.maximum(actual_counts / actual_counts.sum(), 1e-6)
+    return float(np.sum((q - p) * np.log(q / p)))
+
+
+def preprocessing_drift(
+    X_reference: pd.DataFrame,
+    X_new: pd.DataFrame,
+    columns: Optional[list] = None,
+    n_bins: int = 10,
+) -> pd.Series:
+    """
+    Compute the per-column PSI between the reference and the new data.
+
+    Non-numeric columns with categories that do not occur in ``X_reference`` get a
+    PSI of ``inf``, as the fitted preprocessing (e.g. a ``OneHotEncoder``) cannot
+    handle them however rare they are.
+
+    Parameters
+    ----------
+    X_reference : pd.DataFrame
+        Data the preprocessing was fitted on.
+    X_new : pd.DataFrame
+        New data.
+    columns : list, optional
+        Columns to check, by default all columns of ``X_reference``.
+    n_bins : int, optional
+        Number of quantile buckets for numeric columns, by default 10
+
+    Returns
+    -------
+    pd.Series
+        PSI indexed by column name.
+    """
+    if columns is None:
+        columns = list(X_reference.columns)
+
+    drift = {}
+    for col in columns:
+        if not pd.api.types.is_numeric_dtype(X_new[col]) and not (
+            X_new[col].isin(X_reference[col].unique()).all()
+        ):
+            drift[col] = np.inf
+        else:
+            drift[col] = population_stability_index(
+                X_reference[col], X_new[col], n_bins
+            )
+
+    return pd.Series(drift, dtype=float)
+
+
+def _refresh(
+    estimator,
+    X,
+    y,
+    sample_weight,
+    X_new: Optional[pd.DataFrame],
+    X_reference: Optional[pd.DataFrame],
+    drift_threshold: float,
+    update_model: Callable,
+    refit_data: Optional[tuple],
+):
+    # Preprocessing is kept fixed unless the inputs drifted. In that case the spline
+    # knots, categories etc. change meaning, so the old coefficients/trees are of
+    # no use and we fall back to a full refit on ``refit_data``.
+    if X_reference is not None:
+        if X_new is None:
+            raise ValueError("X_new is required to check for drift.")
+        drift = preprocessing_drift(X_reference, X_new)
+        if drift.max() > drift_threshold:
+            if refit_data is None:
+                raise ValueError(
+                    f"Columns {list(drift.index[drift > drift_threshold])} drifted "
+                    "beyond the threshold. Pass the full training data to refit "
+                    "from scratch."
+                )
+            X_full, y_full, sample_weight_full = refit_data
+            estimator = clone(estimator)
+            if isinstance(estimator, Pipeline):
+                step_name = estimator.steps[-1][0]
+                fit_params = {f"{step_name}__sample_weight": sample_weight_full}
+            else:
+                fit_params = {"sample_weight": sample_weight_full}
+            return estimator.fit(X_full, y_full, **fit_params)
+
+    estimator = copy.deepcopy(estimator)  # Do not mutate the previous model
+    if isinstance(estimator, Pipeline):
+        Xt = estimator[:-1].transform(X)
+        model = estimator[-1]
+    else:
+        Xt = X
+        model = estimator
+
+    update_model(model, Xt, y, sample_weight)
+    return estimator
+
+
+def warm_start_glm(
+    estimator,
+    X,
+    y,
+    sample_weight=None,
+    X_new: Optional[pd.DataFrame] = None,
+    X_reference: Optional[pd.DataFrame] = None,
+    drift_threshold: float = 0.2,
+):
+    """
+    Refit a fitted glum ``GeneralizedLinearRegressor`` starting from its coefficients.
+
+    The warm start only changes where the solver starts, not the solution it
+    converges to. ``X``, ``y`` and ``sample_weight`` must therefore be the full
+    cumulative training data, i.e. the previous rows plus the new ones.
+
+    Parameters
+    ----------
+    estimator : GeneralizedLinearRegressor or Pipeline
+        Fitted GLM, or a fitted pipeline with the GLM as its last step.
+    X : pd.DataFrame
+        Cumulative training data.
+    y : array-like
+        Cumulative outcome.
+    sample_weight : array-like, optional
+        Weights for each sample (e.g. exposure), by default None
+    X_new : pd.DataFrame, optional
+        The new rows within ``X``, compared against ``X_reference`` for drift.
+        Required if ``X_reference`` is given.
+    X_reference : pd.DataFrame, optional
+        Data the estimator was previously fitted on. If given and any column of
+        ``X_new`` drifted by more than ``drift_threshold`` (PSI) or contains unseen
+        categories, the preprocessing and the model are refitted from scratch on
+        ``X`` instead. By default None, i.e. no drift check.
+    drift_threshold : float, optional
+        PSI above which a column counts as drifted, by default 0.2
+
+    Returns
+    -------
+    GeneralizedLinearRegressor or Pipeline
+        Refitted copy of ``estimator``.
+
+    Raises
+    ------
+    ValueError
+        If ``X_reference`` is given without ``X_new``.
+    """
+
+    def update_model(model, Xt, y, sample_weight):
+        warm_start = model.get_params()["warm_start"]
+        model.set_params(warm_start=True)  # Start from the previous coef_/intercept_
+        model.fit(Xt, y, sample_weight=sample_weight)
+        model.set_params(warm_start=warm_start)
+
+    return _refresh(
+        estimator,
+        X,
+        y,
+        sample_weight,
+        X_new,
+        X_reference,
+        drift_threshold,
+        update_model,
+        refit_data=(X, y, sample_weight),
+    )
+
+
+def continue_lgbm(
+    estimator,
+    X,
+    y,
+    sample_weight=None,
+    n_estimators: int = 50,
+    X_reference: Optional[pd.DataFrame] = None,
+    drift_threshold: float = 0.2,
+    X_full: Optional[pd.DataFrame] = None,
+    y_full=None,
+    sample_weight_full=None,
+):
+    """
+    Continue boosting a fitted ``LGBMRegressor`` on new data.
+
+    Parameters
+    ----------
+    estimator : LGBMRegressor or Pipeline
+        Fitted LGBM, or a fitted pipeline with the LGBM as its last step.
+    X : pd.DataFrame
+        New training data.
+    y : array-like
+        New outcome.
+    sample_weight : array-like, optional
+        Weights for each sample (e.g. exposure), by default None
+    n_estimators : int, optional
+        Number of boosting rounds to add on top of the existing booster, by default
+        50. The ``n_estimators`` hyperparameter of the model itself is left as is.
+    X_reference : pd.DataFrame, optional
+        Data the estimator was previously fitted on. If given and any column of
+        ``X`` drifted by more than ``drift_threshold`` (PSI) or contains unseen
+        categories, the preprocessing and the model are refitted from scratch on
+        ``X_full`` instead. By default None, i.e. no drift check.
+    drift_threshold : float, optional
+        PSI above which a column counts as drifted, by default 0.2
+    X_full : pd.DataFrame, optional
+        Full cumulative training data, only used for the refit on drift.
+    y_full : array-like, optional
+        Full cumulative outcome, only used for the refit on drift.
+    sample_weight_full : array-like, optional
+        Weights for the full cumulative data, only used for the refit on drift.
+
+    Returns
+    -------
+    LGBMRegressor or Pipeline
+        Copy of ``estimator`` with the additional trees.
+
+    Raises
+    ------
+    ValueError
+        If the inputs drifted and ``X_full`` / ``y_full`` are not given.
+    """
+
+    def update_model(model, Xt, y, sample_weight):
+        booster = model.booster_
+        n_estimators_total = model.get_params()["n_estimators"]
+        model.set_params(n_estimators=n_estimators)
+        model.fit(Xt, y, sample_weight=sample_weight, init_model=booster)
+        model.set_params(n_estimators=n_estimators_total)
+
+    refit_data = None
+    if X_full is not None and y_full is not None:
+        refit_data = (X_full, y_full, sample_weight_full)
+
+    return _refresh(
+        estimator,
+        X,
+        y,
+        sample_weight,
+        X,
+        X_reference,
+        drift_threshold,
+        update_model,
+        refit_data,
+    )
@@ -1,3 +1,4 @@
+from ._binner import FeatureBinner
 from ._winsorizer import Winsorizer
 
-__all__ = ["Winsorizer"]
+__all__ = ["FeatureBinner", "Winsorizer"]
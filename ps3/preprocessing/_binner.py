@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.utils.validation import check_is_fitted
+
+
+class FeatureBinner(BaseEstimator, TransformerMixin):
+    """
+    Clip and/or bin several columns in one pass into int8 codes.
+
+    Parameters
+    ----------
+    spec : dict
+        Maps each column name to its rules, e.g.
+        ``{"VehPower": {"clip": (None, 9)}, "DrivAge": {"edges": [21, 26, 31]}}``.
+        ``"clip"`` is a ``(lower, upper)`` tuple where ``None`` means unbounded.
+        ``"edges"`` are increasing bin edges; a value ``x`` is mapped to ``i`` such
+        that ``edges[i - 1] <= x < edges[i]``, same as ``np.digitize``. Columns
+        without edges keep their (clipped) values, which must then fit into int8.
+    """
+
+    def __init__(self, spec: dict):
+        self.spec = spec
+
+    def fit(self, X, y=None):
+        self.feature_names_in_ = np.asarray(list(self.spec), dtype=object)
+        self.n_features_in_ = len(self.feature_names_in_)
+        self.clip_ = np.empty((self.n_features_in_, 2))
+        self.edges_ = []
+
+        for j, col in enumerate(self.feature_names_in_):
+            rules = self.spec[col]
+            lower, upper = rules.get("clip", (None, None))
+            self.clip_[j] = (
+                -np.inf if lower is None else lower,
+                np.inf if upper is None else upper,
+            )
+
+            edges = rules.get("edges")
+            if edges is not None:
+                edges = np.asarray(edges, dtype=float)
+                if np.any(np.diff(edges) <= 0):
+                    raise ValueError(f"Edges of {col} must be strictly increasing.")
+                if len(edges) > np.iinfo(np.int8).max:
+                    raise ValueError(f"Too many edges for {col} to fit into int8.")
+            else:
+                _check_int8(np.clip(self._column(X, j), *self.clip_[j]), col)
+            self.edges_.append(edges)
+
+        return self
+
+    def transform(self, X):
+        check_is_fitted(self)
+        Xt = np.empty((len(X), self.n_features_in_), dtype=np.int8)
+
+        for j, edges in enumerate(self.edges_):
+            values = self._column(X, j)
+            lower, upper = self.clip_[j]
+            if np.isfinite(lower) or np.isfinite(upper):
+                values = np.clip(values, lower, upper)
+            if edges is None:
+                _check_int8(values, self.feature_names_in_[j])
+                Xt[:, j] = values
+            else:
+                Xt[:, j] = np.searchsorted(edges, values, side="right")
+
+        if isinstance(X, pd.DataFrame):
+            return pd.DataFrame(Xt, columns=self.feature_names_in_, index=X.index)
+        return Xt
+
+    def get_feature_names_out(self, input_features=None):
+        check_is_fitted(self)
+        return self.feature_names_in_.copy()
+
+    def _column(self, X, j):
+        # DataFrames are matched by column name, arrays by position in the spec
+        if isinstance(X, pd.DataFrame):
+            return X[self.feature_names_in_[j]].to_numpy()
+        return np.asarray(X)[:, j]
+
+
+def _check_int8(values, col):
+    # Columns without edges are cast as is, so they must already be valid int8 codes
+    if values.size == 0:
+        return
+    int8 = np.iinfo(np.int8)
+    if np.isnan(values).any():
+        raise ValueError(f"{col} contains NaN, which cannot be stored as int8.")
+    if values.min() < int8.min or values.max() > int8.max:
+        raise ValueError(f"Clipped values of {col} do not fit into int8.")
@@ -0,0 +1,184 @@
+import numpy as np
+import pandas as pd
+import pytest
+from glum import GeneralizedLinearRegressor, TweedieDistribution
+from lightgbm import LGBMRegressor
+from sklearn.compose import ColumnTransformer
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder, SplineTransformer
+
+from ps3.model_training import (
+    continue_lgbm,
+    population_stability_index,
+    warm_start_glm,
+)
+
+
+def _make_data(n, shift=0.0, seed=0):
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame(
+        {"x1": rng.normal(shift, 1, n), "x2": rng.choice(["a", "b", "c"], n)}
+    )
+    X["x2"] = X["x2"].astype("category")
+    mu = np.exp(0.3 * X["x1"] + (X["x2"] == "b") * 0.5)
+    y = rng.poisson(mu).astype(float)
+    w = rng.uniform(0.5, 1, n)
+    return X, y, w
+
+
+def _make_pipeline(model):
+    preprocessor = ColumnTransformer(
+        transformers=[
+            ("num", SplineTransformer(knots="quantile"), ["x1"]),
+            ("cat", OneHotEncoder(sparse_output=False, drop="first"), ["x2"]),
+        ]
+    )
+    return Pipeline(steps=[("preprocessor", preprocessor), ("model", model)])
+
+
+def _knots(pipeline):
+    return pipeline[0].named_transformers_["num"].bsplines_[0].t
+
+
+def test_population_stability_index():
+    rng = np.random.default_rng(0)
+    X = rng.normal(0, 1, 10_000)
+
+    assert population_stability_index(X, rng.normal(0, 1, 10_000)) < 0.01
+    assert population_stability_index(X, rng.normal(1, 1, 10_000)) > 0.2
+    assert population_stability_index(["a", "b"] * 50, ["a"] * 90 + ["b"] * 10) > 0.2
+
+
+def test_warm_start_glm():
+    X_old, y_old, w_old = _make_data(2000, seed=0)
+    X_new, y_new, w_new = _make_data(200, seed=1)
+    X_all = pd.concat([X_old, X_new], ignore_index=True)
+    y_all = np.concatenate([y_old, y_new])
+    w_all = np.concatenate([w_old, w_new])
+    dist = TweedieDistribution(1.5)
+
+    glm = GeneralizedLinearRegressor(family=dist, alpha=0)
+    glm.fit(X_old, y_old, sample_weight=w_old)
+    refreshed = warm_start_glm(glm, X_all, y_all, w_all, X_new=X_new, X_reference=X_old)
+    cold = GeneralizedLinearRegressor(family=dist, alpha=0)
+    cold.fit(X_all, y_all, sample_weight=w_all)
+
+    assert not glm.warm_start  # The previous model is left untouched
+    assert not refreshed.warm_start
+    assert refreshed.n_iter_ < cold.n_iter_
+    np.testing.assert_allclose(refreshed.coef_, cold.coef_, rtol=1e-3, atol=1e-4)
+
+
+@pytest.mark.parametrize("shift", [0.0, 3.0])
+def test_warm_start_glm_pipeline(shift):
+    # A small new slice on top of the history, as in a monthly refresh
+    X_old, y_old, w_old = _make_data(2000, seed=0)
+    X_new, y_new, w_new = _make_data(200, shift=shift, seed=1)
+    X_all = pd.concat([X_old, X_new], ignore_index=True)
+    y_all = np.concatenate([y_old, y_new])
+    w_all = np.concatenate([w_old, w_new])
+
+    pipeline = _make_pipeline(
+        GeneralizedLinearRegressor(family=TweedieDistribution(1.5), alpha=0)
+    )
+    pipeline.fit(X_old, y_old, model__sample_weight=w_old)
+    knots, coef = _knots(pipeline).copy(), pipeline[-1].coef_.copy()
+
+    refreshed = warm_start_glm(
+        pipeline, X_all, y_all, w_all, X_new=X_new, X_reference=X_old
+    )
+
+    # The previous pipeline is left untouched
+    np.testing.assert_array_equal(_knots(pipeline), knots)
+    np.testing.assert_array_equal(pipeline[-1].coef_, coef)
+    # Without drift the knots are reused, with drift everything is refitted
+    assert np.array_equal(_knots(refreshed), knots) == (shift == 0.0)
+    assert not np.array_equal(refreshed[-1].coef_, coef)
+
+
+def test_warm_start_glm_pipeline_unseen_category():
+    X_old, y_old, w_old = _make_data(2000, seed=0)
+    X_new, y_new, w_new = _make_data(200, seed=1)
+    X_new["x2"] = X_new["x2"].cat.add_categories("d")
+    X_new.loc[:4, "x2"] = "d"  # Rare, so the PSI alone stays below the threshold
+    X_all = pd.concat([X_old, X_new], ignore_index=True)
+    y_all = np.concatenate([y_old, y_new])
+    w_all = np.concatenate([w_old, w_new])
+
+    pipeline = _make_pipeline(
+        GeneralizedLinearRegressor(family=TweedieDistribution(1.5), alpha=0)
+    )
+    pipeline.fit(X_old, y_old, model__sample_weight=w_old)
+
+    refreshed = warm_start_glm(
+        pipeline, X_all, y_all, w_all, X_new=X_new, X_reference=X_old
+    )
+
+    # The unseen category triggers a refit instead of an error in the encoder
+    assert "d" in refreshed[0].named_transformers_["cat"].categories_[0]
+
+
+@pytest.mark.parametrize("shift, n_trees", [(0.0, 30), (3.0, 20)])
+def test_continue_lgbm(shift, n_trees):
+    X_old, y_old, w_old = _make_data(2000, seed=0)
+    X_new, y_new, w_new = _make_data(2000, shift=shift, seed=1)
+    X_all = pd.concat([X_old, X_new], ignore_index=True)
+    y_all = np.concatenate([y_old, y_new])
+
+    lgbm = LGBMRegressor(n_estimators=20, verbose=-1).fit(X_old, y_old)
+    refreshed = continue_lgbm(
+        lgbm,
+        X_new,
+        y_new,
+        n_estimators=10,
+        X_reference=X_old,
+        X_full=X_all,
+        y_full=y_all,
+    )
+
+    # Without drift the trees are added on top, with drift the model is refitted
+    assert lgbm.booster_.num_trees() == 20
+    assert refreshed.booster_.num_trees() == n_trees
+    assert refreshed.get_params()["n_estimators"] == 20
+
+
+def test_continue_lgbm_drift_without_full_data():
+    X_old, y_old, _ = _make_data(2000, seed=0)
+    X_new, y_new, _ = _make_data(2000, shift=3.0, seed=1)
+
+    lgbm = LGBMRegressor(n_estimators=20, verbose=-1).fit(X_old, y_old)
+
+    with pytest.raises(ValueError):
+        continue_lgbm(lgbm, X_new, y_new, X_reference=X_old)
+
+
+@pytest.mark.parametrize("shift, n_trees", [(0.0, 30), (3.0, 20)])
+def test_continue_lgbm_pipeline(shift, n_trees):
+    X_old, y_old, w_old = _make_data(2000, seed=0)
+    X_new, y_new, w_new = _make_data(2000, shift=shift, seed=1)
+    X_all = pd.concat([X_old, X_new], ignore_index=True)
+    y_all = np.concatenate([y_old, y_new])
+    w_all = np.concatenate([w_old, w_new])
+
+    pipeline = _make_pipeline(LGBMRegressor(n_estimators=20, verbose=-1))
+    pipeline.fit(X_old, y_old, model__sample_weight=w_old)
+    knots = _knots(pipeline).copy()
+
+    refreshed = continue_lgbm(
+        pipeline,
+        X_new,
+        y_new,
+        w_new,
+        n_estimators=10,
+        X_reference=X_old,
+        X_full=X_all,
+        y_full=y_all,
+        sample_weight_full=w_all,
+    )
+
+    # The previous pipeline is left untouched
+    np.testing.assert_array_equal(_knots(pipeline), knots)
+    assert pipeline[-1].booster_.num_trees() == 20
+    # Without drift the knots are reused, with drift everything is refitted
+    assert np.array_equal(_knots(refreshed), knots) == (shift == 0.0)
+    assert refreshed[-1].booster_.num_trees() == n_trees
@@ -0,0 +1,69 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ps3.data import FEATURE_BINS
+from ps3.preprocessing import FeatureBinner
+
+
+def test_feature_binner_matches_digitize():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "VehPower": rng.integers(4, 16, 1000),
+            "VehAge": rng.integers(0, 30, 1000),
+            "DrivAge": rng.integers(18, 100, 1000),
+        }
+    )
+
+    Xt = FeatureBinner(FEATURE_BINS).fit_transform(df)
+
+    assert (Xt.dtypes == np.int8).all()
+    np.testing.assert_array_equal(Xt["VehPower"], np.minimum(df["VehPower"], 9))
+    np.testing.assert_array_equal(
+        Xt["VehAge"],
+        np.digitize(np.where(df["VehAge"] == 10, 9, df["VehAge"]), bins=[1, 10]),
+    )
+    np.testing.assert_array_equal(
+        Xt["DrivAge"], np.digitize(df["DrivAge"], bins=[21, 26, 31, 41, 51, 71])
+    )
+
+
+def test_feature_binner_pickle():
+    X = np.array([[0, 5], [3, 20], [7, 50]])
+    binner = FeatureBinner({"a": {"edges": [1, 5]}, "b": {"clip": (10, 40)}}).fit(X)
+
+    restored = pickle.loads(pickle.dumps(binner))
+
+    np.testing.assert_array_equal(restored.transform(X), [[0, 10], [1, 20], [2, 40]])
+
+
+@pytest.mark.parametrize(
+    "spec", [{"a": {"edges": [5, 1]}}, {"a": {"clip": (None, 1000)}}]
+)
+def test_feature_binner_invalid_spec(spec):
+    with pytest.raises(ValueError):
+        FeatureBinner(spec).fit(np.array([[0], [500]]))
+
+
+@pytest.mark.parametrize("value", [-200, np.nan])
+def test_feature_binner_transform_out_of_range(value):
+    binner = FeatureBinner({"VehPower": {"clip": (None, 9)}})
+    binner.fit(pd.DataFrame({"VehPower": [4.0, 12.0]}))
+
+    with pytest.raises(ValueError):
+        binner.transform(pd.DataFrame({"VehPower": [5.0, value]}))
+
+
+def test_feature_binner_transform_empty():
+    binner = FeatureBinner(FEATURE_BINS)
+    binner.fit(
+        pd.DataFrame({"VehPower": [4, 12], "VehAge": [0, 5], "DrivAge": [18, 40]})
+    )
+
+    Xt = binner.transform(pd.DataFrame(columns=list(FEATURE_BINS), dtype=float))
+
+    assert Xt.shape == (0, 3)
+    assert (Xt.dtypes == np.int8).all()